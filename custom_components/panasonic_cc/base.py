@@ -5,6 +5,38 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator, AquareaDeviceCoordinator
 
+class SkipUnchangedStateMixin:
+    """Only write state on coordinator updates when it differs from the last written state.
+
+    The snapshot holds the tracked attributes and the coordinator's
+    last_update_success, taken whenever state is written through this mixin.
+    Entities that write state outside coordinator updates should call
+    _async_write_state so the snapshot stays current. List the mixin before
+    the data entity base class so its _handle_coordinator_update wins.
+    """
+
+    _tracked_state_attrs: tuple[str, ...] = ("_attr_native_value", "_attr_available")
+    _last_written_state: tuple | None = None
+
+    def _state_snapshot(self) -> tuple:
+        return (self.coordinator.last_update_success, *(getattr(self, attr) for attr in self._tracked_state_attrs))
+
+    def _async_write_state(self) -> None:
+        """Write the state and remember what was written."""
+        self._last_written_state = self._state_snapshot()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Record the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_written_state = self._state_snapshot()
+
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping unchanged states."""
+        self._async_update_attrs()
+        if self._state_snapshot() != self._last_written_state:
+            self._async_write_state()
+
 class PanasonicDataEntity(CoordinatorEntity[PanasonicDeviceCoordinator]):
 
     _attr_has_entity_name = True
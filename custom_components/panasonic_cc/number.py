@@ -1,5 +1,7 @@
 import logging
-from typing import Callable
+import sys
+from itertools import chain
+from typing import Callable, Literal
 from dataclasses import dataclass
 
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
@@ -16,11 +18,12 @@ from homeassistant.components.number import (
 from aio_panasonic_comfort_cloud import PanasonicDevice, PanasonicDeviceZone, ChangeRequestBuilder
 from aioaquarea import Device as AquareaDevice
 from aioaquarea import ExtendedOperationMode
+from aioaquarea.data import DeviceZone as AquareaDeviceZone
 
 from . import DOMAIN
 from .const import DATA_COORDINATORS, AQUAREA_COORDINATORS
 from .coordinator import PanasonicDeviceCoordinator, AquareaDeviceCoordinator
-from .base import PanasonicDataEntity, AquareaDataEntity
+from .base import PanasonicDataEntity, AquareaDataEntity, SkipUnchangedStateMixin
 
 @dataclass(frozen=True, kw_only=True)
 class PanasonicNumberEntityDescription(NumberEntityDescription):
@@ -32,11 +35,13 @@ class PanasonicNumberEntityDescription(NumberEntityDescription):
 class AquareaNumberEntityDescription(NumberEntityDescription):
     """Describes Aquarea Number entity."""
     zone_id: int
+    target: Literal["heat", "cool"]
 
 def create_zone_damper_description(zone: PanasonicDeviceZone):
+    key = sys.intern(f"zone-{zone.id}-damper")
     return PanasonicNumberEntityDescription(
-        key = f"zone-{zone.id}-damper",
-        translation_key=f"zone-{zone.id}-damper",
+        key = key,
+        translation_key=key,
         name = f"{zone.name} Damper Position",
         icon="mdi:valve",
         native_unit_of_measurement=PERCENTAGE,
@@ -48,58 +53,66 @@ def create_zone_damper_description(zone: PanasonicDeviceZone):
         set_value=lambda builder, value: builder.set_zone_damper(zone.id, value),
     )
 
+def create_zone_heat_target_description(zone_id: int, zone: AquareaDeviceZone):
+    key = sys.intern(f"zone-{zone_id}-heat-target")
+    return AquareaNumberEntityDescription(
+        zone_id=zone_id,
+        target="heat",
+        key=key,
+        translation_key=key,
+        name=f"{zone.name} Heat Target",
+        icon="mdi:thermometer",
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_max_value=zone.heat_max if zone.heat_max is not None else 30,
+        native_min_value=zone.heat_min if zone.heat_min is not None else 10,
+        native_step=1,
+        mode=NumberMode.BOX,
+    )
+
+def create_zone_cool_target_description(zone_id: int, zone: AquareaDeviceZone):
+    key = sys.intern(f"zone-{zone_id}-cool-target")
+    return AquareaNumberEntityDescription(
+        zone_id=zone_id,
+        target="cool",
+        key=key,
+        translation_key=key,
+        name=f"{zone.name} Cool Target",
+        icon="mdi:thermometer",
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        native_max_value=zone.cool_max if zone.cool_max is not None else 30,
+        native_min_value=zone.cool_min if zone.cool_min is not None else 16,
+        native_step=1,
+        mode=NumberMode.BOX,
+    )
+
+def create_zone_target_descriptions(zone_id: int, zone: AquareaDeviceZone):
+    yield create_zone_heat_target_description(zone_id, zone)
+    # Add cool target temperature if supported
+    if zone.cool_max and zone.cool_min:
+        yield create_zone_cool_target_description(zone_id, zone)
+
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
-    devices = []
     data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
-    for data_coordinator in data_coordinators:
-        if data_coordinator.device.has_zones:
-            for zone in data_coordinator.device.parameters.zones:
-                devices.append(PanasonicNumberEntity(
-                    data_coordinator,
-                    create_zone_damper_description(zone)))
+    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
+
+    panasonic_entities = [
+        PanasonicNumberEntity(data_coordinator, create_zone_damper_description(zone))
+        for data_coordinator in data_coordinators
+        if data_coordinator.device.has_zones
+        for zone in data_coordinator.device.parameters.zones
+    ]
 
     # Aquarea Number entities for temperature targets
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    for coordinator in aquarea_coordinators:
-        for zone_id in coordinator.device.zones:
-            zone = coordinator.device.zones.get(zone_id)
-            # Add heat target temperature
-            devices.append(AquareaNumberEntity(
-                coordinator,
-                AquareaNumberEntityDescription(
-                    zone_id=zone_id,
-                    key=f"zone-{zone_id}-heat-target",
-                    translation_key=f"zone-{zone_id}-heat-target",
-                    name=f"{zone.name} Heat Target",
-                    icon="mdi:thermometer",
-                    device_class=NumberDeviceClass.TEMPERATURE,
-                    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                    native_max_value=zone.heat_max if zone.heat_max is not None else 30,
-                    native_min_value=zone.heat_min if zone.heat_min is not None else 10,
-                    native_step=1,
-                    mode=NumberMode.BOX,
-                )
-            ))
-            # Add cool target temperature if supported
-            if zone.cool_max and zone.cool_min:
-                devices.append(AquareaNumberEntity(
-                    coordinator,
-                    AquareaNumberEntityDescription(
-                        zone_id=zone_id,
-                        key=f"zone-{zone_id}-cool-target",
-                        translation_key=f"zone-{zone_id}-cool-target",
-                        name=f"{zone.name} Cool Target",
-                        icon="mdi:thermometer",
-                        device_class=NumberDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        native_max_value=zone.cool_max if zone.cool_max is not None else 30,
-                        native_min_value=zone.cool_min if zone.cool_min is not None else 16,
-                        native_step=1,
-                        mode=NumberMode.BOX,
-                    )
-                ))
-
-    async_add_entities(devices)
+    aquarea_entities = [
+        AquareaNumberEntity(coordinator, description)
+        for coordinator in aquarea_coordinators
+        for zone_id, zone in coordinator.device.zones.items()
+        for description in create_zone_target_descriptions(zone_id, zone)
+    ]
+
+    async_add_entities(chain(panasonic_entities, aquarea_entities))
 
 class PanasonicNumberEntity(PanasonicDataEntity, NumberEntity):
     """Representation of a Panasonic Number."""
@@ -124,9 +137,11 @@ class PanasonicNumberEntity(PanasonicDataEntity, NumberEntity):
         self._attr_native_value = self.entity_description.get_value(self.coordinator.device)
 
 
-class AquareaNumberEntity(AquareaDataEntity, NumberEntity):
+class AquareaNumberEntity(SkipUnchangedStateMixin, AquareaDataEntity, NumberEntity):
     """Aquarea Number entity for setting target temperatures."""
 
+    _tracked_state_attrs = ("_attr_native_value",)
+
     entity_description: AquareaNumberEntityDescription
 
     def __init__(self, coordinator: AquareaDeviceCoordinator, description: AquareaNumberEntityDescription):
@@ -139,22 +154,23 @@ class AquareaNumberEntity(AquareaDataEntity, NumberEntity):
         zone_id = self.entity_description.zone_id
         temperature = int(value)
         
-        # Determine if we're setting heat or cool based on key
-        if "heat-target" in self.entity_description.key:
+        # Determine if we're setting heat or cool based on the description target
+        target = self.entity_description.target
+        if target == "heat":
             # Temporarily switch mode to HEAT if needed
             original_mode = self.coordinator.device.mode
             if original_mode not in (ExtendedOperationMode.HEAT, ExtendedOperationMode.AUTO_HEAT):
                 _LOGGER.debug(f"Switching to HEAT mode to set heat target for zone {zone_id}")
             await self.coordinator.device.set_temperature(temperature, zone_id)
-        elif "cool-target" in self.entity_description.key:
+        elif target == "cool":
             # Temporarily switch mode to COOL if needed
             original_mode = self.coordinator.device.mode
             if original_mode not in (ExtendedOperationMode.COOL, ExtendedOperationMode.AUTO_COOL):
                 _LOGGER.debug(f"Switching to COOL mode to set cool target for zone {zone_id}")
             await self.coordinator.device.set_temperature(temperature, zone_id)
-        
+
         self._attr_native_value = temperature
-        self.async_write_ha_state()
+        self._async_write_state()
         await self.coordinator.async_request_refresh()
 
     def _async_update_attrs(self) -> None:
@@ -162,14 +178,14 @@ class AquareaNumberEntity(AquareaDataEntity, NumberEntity):
         zone = self.coordinator.device.zones.get(self.entity_description.zone_id)
         if zone:
             # When heatSet/coolSet is not available from API, display current temperature as reference
-            if "heat-target" in self.entity_description.key:
+            if self.entity_description.target == "heat":
                 # Try to get target temperature first, fallback to current temperature
                 temp = zone.heat_target_temperature
                 if temp is None:
                     # API doesn't return setpoint, use current temperature as reference
                     temp = zone.temperature
                 self._attr_native_value = temp
-            elif "cool-target" in self.entity_description.key:
+            else:
                 temp = zone.cool_target_temperature
                 if temp is None:
                     temp = zone.temperature
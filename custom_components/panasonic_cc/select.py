@@ -1,6 +1,7 @@
 from typing import Callable, Any
 from dataclasses import dataclass
 import logging
+from itertools import chain
 
 from homeassistant.core import HomeAssistant
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
@@ -9,7 +10,7 @@ from .const import DOMAIN, DATA_COORDINATORS, AQUAREA_COORDINATORS, SELECT_HORIZ
 from aio_panasonic_comfort_cloud import PanasonicDevice, ChangeRequestBuilder, constants
 
 from .coordinator import PanasonicDeviceCoordinator, AquareaDeviceCoordinator
-from .base import PanasonicDataEntity, AquareaDataEntity
+from .base import PanasonicDataEntity, AquareaDataEntity, SkipUnchangedStateMixin
 from aioaquarea import Device as AquareaDevice, SpecialStatus, PowerfulTime
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,12 +31,16 @@ class AquareaSelectEntityDescription(SelectEntityDescription):
     is_available: Callable[[AquareaDevice], bool]
 
 
+_AIRSWINGLR_OPTIONS = [opt.name for opt in constants.AirSwingLR if opt != constants.AirSwingLR.Unavailable]
+_SPECIAL_STATUS_OPTIONS = ["NORMAL", "ECO", "COMFORT"]
+_POWERFUL_TIME_OPTIONS = ["OFF", "30MIN", "60MIN", "90MIN"]
+
 HORIZONTAL_SWING_DESCRIPTION = PanasonicSelectEntityDescription(
     key=SELECT_HORIZONTAL_SWING, 
     translation_key=SELECT_HORIZONTAL_SWING,
     icon="mdi:swap-horizontal",
     name="Horizontal Swing Mode",
-    options= [opt.name for opt in constants.AirSwingLR if opt != constants.AirSwingLR.Unavailable],
+    options=_AIRSWINGLR_OPTIONS,
     set_option = lambda builder, new_value : builder.set_horizontal_swing(new_value),
     get_current_option = lambda device : device.parameters.horizontal_swing_mode.name,
     is_available = lambda device : device.has_horizontal_swing
@@ -57,7 +62,7 @@ AQUAREA_SPECIAL_STATUS_DESCRIPTION = AquareaSelectEntityDescription(
     translation_key="special_status",
     name="Special Status",
     icon="mdi:thermostat",
-    options=["NORMAL", "ECO", "COMFORT"],
+    options=_SPECIAL_STATUS_OPTIONS,
     get_current_option=lambda device: device.special_status.name if device.special_status else "NORMAL",
     set_option=lambda device, value: device.set_special_status(SpecialStatus[value] if value != "NORMAL" else None),
     is_available=lambda device: device.support_special_status
@@ -68,7 +73,7 @@ AQUAREA_POWERFUL_TIME_DESCRIPTION = AquareaSelectEntityDescription(
     translation_key="powerful_time",
     name="Powerful Mode",
     icon="mdi:timer",
-    options=["OFF", "30MIN", "60MIN", "90MIN"],
+    options=_POWERFUL_TIME_OPTIONS,
     get_current_option=lambda device: device.powerful_time.name,
     set_option=lambda device, value: device.set_powerful_time(PowerfulTime[value]),
     is_available=lambda device: True
@@ -76,20 +81,22 @@ AQUAREA_POWERFUL_TIME_DESCRIPTION = AquareaSelectEntityDescription(
 
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
-    entities = []
     data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
     aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    
-    for coordinator in data_coordinators:
-        entities.append(PanasonicSelectEntity(coordinator, HORIZONTAL_SWING_DESCRIPTION))
-        entities.append(PanasonicSelectEntity(coordinator, VERTICAL_SWING_DESCRIPTION))
-    
+
+    panasonic_entities = [
+        PanasonicSelectEntity(coordinator, description)
+        for coordinator in data_coordinators
+        for description in (HORIZONTAL_SWING_DESCRIPTION, VERTICAL_SWING_DESCRIPTION)
+    ]
     # Add Aquarea entities
-    for coordinator in aquarea_coordinators:
-        entities.append(AquareaSelectEntity(coordinator, AQUAREA_SPECIAL_STATUS_DESCRIPTION))
-        entities.append(AquareaSelectEntity(coordinator, AQUAREA_POWERFUL_TIME_DESCRIPTION))
-        
-    async_add_entities(entities)
+    aquarea_entities = [
+        AquareaSelectEntity(coordinator, description)
+        for coordinator in aquarea_coordinators
+        for description in (AQUAREA_SPECIAL_STATUS_DESCRIPTION, AQUAREA_POWERFUL_TIME_DESCRIPTION)
+    ]
+
+    async_add_entities(chain(panasonic_entities, aquarea_entities))
 
 class PanasonicSelectEntityBase(SelectEntity):
     """Base class for all select entities."""
@@ -99,6 +106,9 @@ class PanasonicSelectEntity(PanasonicDataEntity, PanasonicSelectEntityBase):
 
     def __init__(self, coordinator: PanasonicDeviceCoordinator, description: PanasonicSelectEntityDescription):
         self.entity_description = description
+        self._is_available = description.is_available
+        self._get_current_option = description.get_current_option
+        # Options only depend on device features, so build them once per entity
         if description.get_options is not None:
             self._attr_options = description.get_options(coordinator.device)
         super().__init__(coordinator, description.key)
@@ -106,7 +116,7 @@ class PanasonicSelectEntity(PanasonicDataEntity, PanasonicSelectEntityBase):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.entity_description.is_available(self.coordinator.device)
+        return self._is_available(self.coordinator.device)
 
     async def async_select_option(self, option: str) -> None:
         builder = self.coordinator.get_change_request_builder()
@@ -116,31 +126,35 @@ class PanasonicSelectEntity(PanasonicDataEntity, PanasonicSelectEntityBase):
         self.async_write_ha_state()
 
     def _async_update_attrs(self) -> None:
-        self.current_option = self.entity_description.get_current_option(self.coordinator.device)
+        self._attr_current_option = self._get_current_option(self.coordinator.device)
 
 
-class AquareaSelectEntity(AquareaDataEntity, SelectEntity):
+class AquareaSelectEntity(SkipUnchangedStateMixin, AquareaDataEntity, SelectEntity):
     """Representation of an Aquarea select entity."""
 
+    _tracked_state_attrs = ("_attr_current_option", "available")
+
     entity_description: AquareaSelectEntityDescription
 
     def __init__(self, coordinator: AquareaDeviceCoordinator, description: AquareaSelectEntityDescription):
         self.entity_description = description
+        self._is_available = description.is_available
+        self._get_current_option = description.get_current_option
         super().__init__(coordinator, description.key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.entity_description.is_available(self.coordinator.device)
+        return self._is_available(self.coordinator.device)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         await self.entity_description.set_option(self.coordinator.device, option)
         self._attr_current_option = option
-        self.async_write_ha_state()
+        self._async_write_state()
         await self.coordinator.async_request_refresh()
 
     def _async_update_attrs(self) -> None:
         """Update the current option."""
-        self._attr_current_option = self.entity_description.get_current_option(self.coordinator.device)
+        self._attr_current_option = self._get_current_option(self.coordinator.device)
 
@@ -1,6 +1,8 @@
 from typing import Callable, Any
 from dataclasses import dataclass
 import logging
+import sys
+from itertools import chain
 
 from homeassistant.const import UnitOfTemperature, EntityCategory, PERCENTAGE
 from homeassistant.components.sensor import (
@@ -19,7 +21,7 @@ from .const import (
     ENERGY_COORDINATORS,
     AQUAREA_COORDINATORS
     )
-from .base import PanasonicDataEntity, PanasonicEnergyEntity, AquareaDataEntity
+from .base import PanasonicDataEntity, PanasonicEnergyEntity, AquareaDataEntity, SkipUnchangedStateMixin
 from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator, AquareaDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -216,10 +218,34 @@ AQUAREA_FAULT_STATUS_DESCRIPTION = AquareaSensorEntityDescription(
     is_available=lambda device: True
 )
 
+PANASONIC_SENSOR_DESCRIPTIONS = (
+    INSIDE_TEMPERATURE_DESCRIPTION,
+    OUTSIDE_TEMPERATURE_DESCRIPTION,
+    LAST_UPDATE_TIME_DESCRIPTION,
+    DATA_AGE_DESCRIPTION,
+    DATA_MODE_DESCRIPTION,
+)
+ENERGY_SENSOR_DESCRIPTIONS = (
+    DAILY_ENERGY_DESCRIPTION,
+    DAILY_COOLING_ENERGY_DESCRIPTION,
+    DAILY_HEATING_ENERGY_DESCRIPTION,
+    POWER_DESCRIPTION,
+    COOLING_POWER_DESCRIPTION,
+    HEATING_POWER_DESCRIPTION,
+)
+AQUAREA_SENSOR_DESCRIPTIONS = (
+    AQUAREA_OUTSIDE_TEMPERATURE_DESCRIPTION,
+    AQUAREA_PUMP_DUTY_DESCRIPTION,
+    AQUAREA_DIRECTION_DESCRIPTION,
+    AQUAREA_DEVICE_MODE_STATUS_DESCRIPTION,
+    AQUAREA_FAULT_STATUS_DESCRIPTION,
+)
+
 def create_zone_temperature_description(zone: PanasonicDeviceZone):
+    key = sys.intern(f"zone-{zone.id}-temperature")
     return PanasonicSensorEntityDescription(
-        key = f"zone-{zone.id}-temperature",
-        translation_key=f"zone-{zone.id}-temperature",
+        key = key,
+        translation_key=key,
         name = f"{zone.name} Temperature",
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -231,101 +257,102 @@ def create_zone_temperature_description(zone: PanasonicDeviceZone):
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    entities = []
     data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
     energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = hass.data[DOMAIN][ENERGY_COORDINATORS]
     aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
 
-    for coordinator in data_coordinators:
-        entities.append(PanasonicSensorEntity(coordinator, INSIDE_TEMPERATURE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, OUTSIDE_TEMPERATURE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, LAST_UPDATE_TIME_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, DATA_AGE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, DATA_MODE_DESCRIPTION))
-        if coordinator.device.has_zones:
-            for zone in coordinator.device.parameters.zones:
-                entities.append(PanasonicSensorEntity(
-                    coordinator,
-                    create_zone_temperature_description(zone)))
-
-    for coordinator in energy_coordinators:
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_COOLING_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_HEATING_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, POWER_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, COOLING_POWER_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, HEATING_POWER_DESCRIPTION))
-
-    for coordinator in aquarea_coordinators:
-        entities.append(AquareaSensorEntity(coordinator, AQUAREA_OUTSIDE_TEMPERATURE_DESCRIPTION))
-        entities.append(AquareaSensorEntity(coordinator, AQUAREA_PUMP_DUTY_DESCRIPTION))
-        entities.append(AquareaSensorEntity(coordinator, AQUAREA_DIRECTION_DESCRIPTION))
-        entities.append(AquareaSensorEntity(coordinator, AQUAREA_DEVICE_MODE_STATUS_DESCRIPTION))
-        entities.append(AquareaSensorEntity(coordinator, AQUAREA_FAULT_STATUS_DESCRIPTION))
-
-    async_add_entities(entities)
+    panasonic_entities = [
+        PanasonicSensorEntity(coordinator, description)
+        for coordinator in data_coordinators
+        for description in PANASONIC_SENSOR_DESCRIPTIONS
+    ]
+    zone_entities = [
+        PanasonicSensorEntity(coordinator, create_zone_temperature_description(zone))
+        for coordinator in data_coordinators
+        if coordinator.device.has_zones
+        for zone in coordinator.device.parameters.zones
+    ]
+    energy_entities = [
+        PanasonicEnergySensorEntity(coordinator, description)
+        for coordinator in energy_coordinators
+        for description in ENERGY_SENSOR_DESCRIPTIONS
+    ]
+    aquarea_entities = [
+        AquareaSensorEntity(coordinator, description)
+        for coordinator in aquarea_coordinators
+        for description in AQUAREA_SENSOR_DESCRIPTIONS
+    ]
+
+    async_add_entities(chain(panasonic_entities, zone_entities, energy_entities, aquarea_entities))
 
 
 class PanasonicSensorEntityBase(SensorEntity):
     """Base class for all sensor entities."""
     entity_description: PanasonicSensorEntityDescription # type: ignore[override]
 
-class PanasonicSensorEntity(PanasonicDataEntity, PanasonicSensorEntityBase):
+class PanasonicSensorEntity(SkipUnchangedStateMixin, PanasonicDataEntity, PanasonicSensorEntityBase):
     
     def __init__(self, coordinator: PanasonicDeviceCoordinator, description: PanasonicSensorEntityDescription):
         self.entity_description = description
+        self._is_available = description.is_available
+        self._get_state = description.get_state
         super().__init__(coordinator, description.key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if self.entity_description.is_available is None:
-            return False        
-        return self.entity_description.is_available(self.coordinator.device)
+        if self._is_available is None:
+            return False
+        return self._is_available(self.coordinator.device)
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
-        if self.entity_description.is_available:
-            self._attr_available = self.entity_description.is_available(self.coordinator.device)
-        if self.entity_description.get_state:
-            self._attr_native_value = self.entity_description.get_state(self.coordinator.device)
+        device = self.coordinator.device
+        if self._is_available:
+            self._attr_available = self._is_available(device)
+        if self._get_state:
+            self._attr_native_value = self._get_state(device)
 
-class PanasonicEnergySensorEntity(PanasonicEnergyEntity, SensorEntity):
+class PanasonicEnergySensorEntity(SkipUnchangedStateMixin, PanasonicEnergyEntity, SensorEntity):
     
     entity_description: PanasonicEnergySensorEntityDescription # type: ignore[override]
 
     def __init__(self, coordinator: PanasonicDeviceEnergyCoordinator, description: PanasonicEnergySensorEntityDescription):
         self.entity_description = description
+        self._get_state = description.get_state
         super().__init__(coordinator, description.key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self._attr_available
-    
+
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
-        value = self.entity_description.get_state(self.coordinator.energy)
+        value = self._get_state(self.coordinator.energy)
         self._attr_available = value is not None
         self._attr_native_value = value
 
-class AquareaSensorEntity(AquareaDataEntity, SensorEntity):
+class AquareaSensorEntity(SkipUnchangedStateMixin, AquareaDataEntity, SensorEntity):
     
     entity_description: AquareaSensorEntityDescription
 
     def __init__(self, coordinator: AquareaDeviceCoordinator, description: AquareaSensorEntityDescription):
         self.entity_description = description
+        self._is_available = description.is_available
+        self._get_state = description.get_state
         super().__init__(coordinator, description.key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        value = self.entity_description.is_available(self.coordinator.device) if self.entity_description.is_available else None 
+        value = self._is_available(self.coordinator.device) if self._is_available else None
         return value if value is not None else False
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
-        if self.entity_description.is_available:
-            self._attr_available = self.entity_description.is_available(self.coordinator.device)
-        if self.entity_description.get_state:
-            self._attr_native_value = self.entity_description.get_state(self.coordinator.device)
\ No newline at end of file
+        device = self.coordinator.device
+        if self._is_available:
+            self._attr_available = self._is_available(device)
+        if self._get_state:
+            self._attr_native_value = self._get_state(device)
\ No newline at end of file